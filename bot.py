@@ -1,105 +1,548 @@
 # bot.py
 
 import os
-import json
+import time
+import asyncio
 import random
+import shlex
 import logging
-from datetime import datetime
+import functools
+from operator import itemgetter
+from collections import defaultdict
+from datetime import date, datetime
 from dotenv import load_dotenv
 
-from telegram import Update
+import orjson
+from sortedcontainers import SortedKeyList
+
+from telegram import Update, LinkPreviewOptions
 from telegram.constants import ParseMode
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.ext import AIORateLimiter, Application, CommandHandler, ContextTypes
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from quotes import QUOTES
-
 # --- Configuration & Setup ---
 load_dotenv()
 TOKEN = os.getenv("TELEGRAM_TOKEN")
 DATA_FILE = "data.json"
+FLUSH_INTERVAL = 3  # seconds between write-backs of dirty data
+NO_LINK_PREVIEW = LinkPreviewOptions(is_disabled=True)
+ADMIN_CACHE_TTL = 300  # seconds a group's admin list is reused before refetching
 
 logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # --- Data Handling ---
-def load_data():
+WRITE_BUFFER_SIZE = 1 << 20
+
+def _write_atomic(path, payload):
+    """Write payload to a temp file in a single call, then swap it into place.
+    Returns the new file's mtime."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return os.stat(path).st_mtime
+
+SCHEMA_VERSION = 2
+
+def _migrate_v1_to_v2(data):
+    """Convert legacy daily targets (a "target" key or plain strings) to
+    {text, completed, completed_at} dicts. Returns True if data was changed."""
+    if data.get("_schema_version") == SCHEMA_VERSION:
+        return False
+    for users in data.get("daily_targets", {}).values():
+        for user_data in users.values():
+            old_targets = user_data.pop("target", [])
+            targets = user_data.get("targets", old_targets)
+            if isinstance(targets, str):
+                # Single target (very old format)
+                targets = [targets]
+            elif not isinstance(targets, list):
+                targets = []
+            user_data["targets"] = [
+                {"text": target, "completed": False, "completed_at": None} if isinstance(target, str) else target
+                for target in targets
+            ]
+    data["_schema_version"] = SCHEMA_VERSION
+    return True
+
+def _canonical_date(date_str):
+    """Return date_str as zero-padded YYYY-MM-DD, or unchanged if it isn't a date at all."""
     try:
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {
-            "milestones": [], 
-            "daily_targets": {}, 
-            "reminders": {},
-            "subjects": {},  # {subject_name: {topics: [], description: ""}}
-            "user_progress": {}  # {user_id: {subject_name: {completed_topics: [], completion_date: ""}}}
-        }
-
-def save_data(data):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=4)
+        return _parse_date(date_str).isoformat()
+    except ValueError:
+        logger.warning("Leaving unparseable date %r in %s as is", date_str, DATA_FILE)
+        return date_str
+
+def _normalize_dates(data):
+    """Rewrite stored dates (e.g. "2025-8-3") in canonical form so string sorting and bisect
+    order them correctly. Returns True if data was changed."""
+    changed = False
+    for key in ("milestones", "past_milestones"):
+        for milestone in data.get(key, []):
+            canonical = _canonical_date(milestone["date"])
+            if canonical != milestone["date"]:
+                milestone["date"] = canonical
+                changed = True
+    daily_targets = data.get("daily_targets", {})
+    for date_str in list(daily_targets):
+        canonical = _canonical_date(date_str)
+        if canonical == date_str:
+            continue
+        # Merge into an existing canonical day rather than overwrite it
+        merged = daily_targets.setdefault(canonical, {})
+        for user_id, user_data in daily_targets.pop(date_str).items():
+            if user_id in merged:
+                merged[user_id]["targets"].extend(user_data["targets"])
+            else:
+                merged[user_id] = user_data
+        changed = True
+    return changed
+
+# Keys rebuilt by _hydrate on every load and never written to data.json
+DERIVED_KEYS = ("_topic_index", "_totals", "_by_user")
+
+def _new_user_targets():
+    return {"name": "", "targets": []}
+
+def _new_date_targets():
+    return defaultdict(_new_user_targets)
+
+def _hydrate(data):
+    """Swap persisted JSON shapes for the in-memory structures handlers work on."""
+    # Upcoming milestones; ones whose date has passed are moved to past_milestones
+    data["milestones"] = SortedKeyList(data.get("milestones", []), key=itemgetter("date"))
+    data["past_milestones"] = SortedKeyList(data.get("past_milestones", []), key=itemgetter("date"))
+
+    # daily_targets[date][user_id] creates missing levels on write; read paths
+    # must keep using `in`/.get() so they don't add empty entries
+    data["daily_targets"] = defaultdict(_new_date_targets, {
+        date_str: defaultdict(_new_user_targets, users)
+        for date_str, users in data.get("daily_targets", {}).items()
+    })
+    # _by_user[user_id][date] is the same dict as daily_targets[date][user_id],
+    # so per-user lookups need no probing of the outer date level
+    by_user = {}
+    for date_str, users in data["daily_targets"].items():
+        for user_id, user_targets in users.items():
+            by_user.setdefault(user_id, {})[date_str] = user_targets
+    data["_by_user"] = by_user
+
+    # completed_topics become sets, and _topic_index maps
+    # {subject: {topic: {user_ids}}} so topic removals only touch affected users
+    topic_index = {}
+    for user_id, progress in data.setdefault("user_progress", {}).items():
+        for subject_name, subject_progress in progress.items():
+            if not isinstance(subject_progress, dict):
+                continue  # the user's "name"
+            completed = set(subject_progress.get("completed_topics", []))
+            subject_progress["completed_topics"] = completed
+            subject_index = topic_index.setdefault(subject_name, {})
+            for topic in completed:
+                subject_index.setdefault(topic, set()).add(user_id)
+    data["_topic_index"] = topic_index
+
+    # Syllabus topic counts, kept current by _set_subject_total
+    per_subject = {name: info["total_topics"] for name, info in data.setdefault("subjects", {}).items()}
+    data["_totals"] = {"all": sum(per_subject.values()), "per_subject": per_subject}
+
+def _json_default(obj):
+    if isinstance(obj, SortedKeyList):
+        return list(obj)
+    if isinstance(obj, set):
+        return sorted(obj)
+    raise TypeError
+
+class DataStore:
+    """Keeps data.json parsed in memory; a periodic job writes it back when dirty.
+    File I/O runs in the default executor so it never blocks the event loop."""
+
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+        self._dirty = False
+        self._mtime = None  # mtime of data.json as of our last load or flush
+        self._last_payload = None  # bytes of our last flush, while the file still holds them
+        self._lock = asyncio.Lock()
+
+    def _read(self):
+        """Return (parsed data, mtime); mtime is None when there is no file yet.
+        Raises orjson.JSONDecodeError for a corrupt file. Safe to run off the event loop."""
+        try:
+            with open(self.path, 'rb') as f:
+                return orjson.loads(f.read()), os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            return {
+                "milestones": [], 
+                "daily_targets": {}, 
+                "reminders": {},
+                "subjects": {},  # {subject_name: {topics: [], description: ""}}
+                "user_progress": {}  # {user_id: {subject_name: {completed_topics: [], completion_date: ""}}}
+            }, None
+
+    def _install(self, data, mtime):
+        # Only a migrated data.json needs writing back, not the empty defaults
+        changed = _migrate_v1_to_v2(data)
+        changed = _normalize_dates(data) or changed
+        if changed and mtime is not None:
+            self._dirty = True
+        _hydrate(data)
+        self._data = data
+        self._mtime = mtime
+        self._last_payload = None
+
+    async def load(self):
+        loop = asyncio.get_running_loop()
+        self._install(*await loop.run_in_executor(None, self._read))
+
+    def get(self):
+        if self._data is None:
+            # Normally loaded at startup by load(); fall back to a blocking read
+            self._install(*self._read())
+        return self._data
+
+    async def reload_if_changed(self):
+        """Pick up edits made to data.json outside the bot, unless we hold unsaved changes."""
+        if self._data is None or self._dirty or self._lock.locked():
+            return
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._mtime:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            data, mtime = await loop.run_in_executor(None, self._read)
+        except orjson.JSONDecodeError as e:
+            # Likely a half-written edit; keep serving what we have and retry next tick
+            logger.warning("%s changed on disk but is not valid JSON (%s); keeping current data", self.path, e)
+            return
+        if self._dirty:
+            return  # a handler changed something meanwhile; our next flush wins
+        logger.info("%s changed on disk, reloading", self.path)
+        self._install(data, mtime)
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    async def flush(self):
+        async with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            # Serialize on the loop so handlers can't mutate data mid-dump
+            persisted = {key: value for key, value in self._data.items() if key not in DERIVED_KEYS}
+            payload = orjson.dumps(persisted, default=_json_default, option=orjson.OPT_INDENT_2)
+            if payload == self._last_payload:
+                return  # marked dirty, but nothing actually changed since the last write
+            loop = asyncio.get_running_loop()
+            try:
+                mtime = await loop.run_in_executor(None, _write_atomic, self.path, payload)
+            except OSError:
+                self._dirty = True  # keep the changes so the next flush retries them
+                raise
+            self._mtime = mtime
+            self._last_payload = payload
+
+store = DataStore(DATA_FILE)
+
+async def load_data_on_startup(application: Application):
+    await store.load()
+
+async def flush_data_job(context: ContextTypes.DEFAULT_TYPE):
+    await store.reload_if_changed()
+    await store.flush()
+
+async def flush_data_on_shutdown(application: Application):
+    await store.flush()
 
 # --- Helper Functions ---
+TARGETS_TIPS_TEMPLATE = (
+    "\n💡 Use `/complete_goal {date_str} <number>` to mark as done\n"
+    "💡 Use `/edit_target <number> <new_goal>` to edit\n"
+    "💡 Use `/delete_target <number>` to delete"
+)
+
+# Rows of the group's today-targets message; target rows are filled from the target dict
+TODAY_USER_TEMPLATE = "**{i}) {name}**\n"
+TODAY_TARGET_DONE_TEMPLATE = "   ✅ ~~{text}~~\n"
+TODAY_TARGET_OPEN_TEMPLATE = "   ⭕ {text}\n"
+
+# Dashboard bars for 0-100% in 10% steps, indexed by the number of filled cells
+PROGRESS_BARS = tuple("🟩" * filled + "⬜" * (10 - filled) for filled in range(11))
+
+_QUOTES = None  # loaded from quotes.py on first use
+
 def get_random_quote():
-    quote, author = random.choice(QUOTES)
+    global _QUOTES
+    if _QUOTES is None:
+        from quotes import QUOTES
+        _QUOTES = QUOTES
+    quote, author = _QUOTES[random.randrange(len(_QUOTES))]
     return f'"{quote}" - {author}'
 
+@functools.lru_cache(maxsize=512)
+def _parse_date(date_str):
+    """Validate a user-supplied YYYY-MM-DD date (zero padding optional); raises ValueError.
+    Store its .isoformat(), not the raw input."""
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+@functools.lru_cache(maxsize=512)
+def _stored_date(date_str):
+    """Parse a stored date, which is always canonical YYYY-MM-DD."""
+    return date.fromisoformat(date_str)
+
+def _next_milestone(data, today_str):
+    """Return the first milestone dated after today, or None."""
+    milestones = data["milestones"]
+    if milestones and milestones[0]["date"] > today_str:
+        return milestones[0]  # usual case once elapsed milestones are archived
+    idx = milestones.bisect_key_right(today_str)
+    return milestones[idx] if idx < len(milestones) else None
+
+def _archive_past_milestones(data, today_str):
+    """Move milestones dated today or earlier to past_milestones. Returns True if any moved."""
+    milestones = data["milestones"]
+    idx = milestones.bisect_key_right(today_str)
+    if not idx:
+        return False
+    data["past_milestones"].update(milestones[:idx])
+    del milestones[:idx]
+    return True
+
+def _all_milestones(data):
+    """Past then upcoming milestones, in the order view_plan numbers them."""
+    return [*data["past_milestones"], *data["milestones"]]
+
+def _add_milestone(data, milestone, today_str):
+    if milestone["date"] > today_str:
+        data["milestones"].add(milestone)
+    else:
+        data["past_milestones"].add(milestone)
+
+def _pop_milestone(data, index):
+    """Remove and return a milestone by its 0-based position in _all_milestones."""
+    past = data["past_milestones"]
+    if index < len(past):
+        return past.pop(index)
+    return data["milestones"].pop(index - len(past))
+
+def _user_targets(data, date_str, user_id):
+    """Return a user's target entry for a date, or None if they have none."""
+    return data["_by_user"].get(user_id, {}).get(date_str)
+
+def _ensure_user_targets(data, date_str, user_id, user_name):
+    """Return a user's target entry for a date, creating and indexing it if needed."""
+    user_dates = data["_by_user"].setdefault(user_id, {})
+    if date_str not in user_dates:
+        # Name the entry once, when it is created; later adds leave it untouched
+        user_targets = data["daily_targets"][date_str][user_id]
+        user_targets["name"] = user_name
+        user_dates[date_str] = user_targets
+    return user_dates[date_str]
+
+def _drop_user_targets(data, date_str, user_id):
+    """Remove a user's (now empty) entry for a date, and the date once nobody is left."""
+    del data["daily_targets"][date_str][user_id]
+    if not data["daily_targets"][date_str]:
+        del data["daily_targets"][date_str]
+    user_dates = data["_by_user"][user_id]
+    del user_dates[date_str]
+    if not user_dates:
+        del data["_by_user"][user_id]
+
+def _set_subject_total(data, subject_name, total):
+    """Record a subject's topic count (None when the subject is deleted) and keep _totals in step."""
+    totals = data["_totals"]
+    if total is None:
+        totals["all"] -= totals["per_subject"].pop(subject_name, 0)
+        return
+    data["subjects"][subject_name]["total_topics"] = total
+    # Assign in place so the subject keeps its position in the dashboard
+    totals["all"] += total - totals["per_subject"].get(subject_name, 0)
+    totals["per_subject"][subject_name] = total
+
+def _remove_topic_progress(data, subject_name, topic_name):
+    """Drop a topic from every user who completed it. Returns those users' ids."""
+    affected_users = data["_topic_index"].get(subject_name, {}).pop(topic_name, set())
+    for user_id in affected_users:
+        data["user_progress"][user_id][subject_name]["completed_topics"].discard(topic_name)
+    return affected_users
+
+_admin_cache = {}  # {chat_id: (expires_at, frozenset(admin_user_ids))}
+
 async def is_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
     chat_id = update.effective_chat.id
     user_id = update.effective_user.id
     if update.effective_chat.type == 'private':
         return True
+    now = time.monotonic()
+    cached = _admin_cache.get(chat_id)
+    if cached and cached[0] > now:
+        return user_id in cached[1]
     admins = await context.bot.get_chat_administrators(chat_id)
-    return any(admin.user.id == user_id for admin in admins)
+    admin_ids = frozenset(admin.user.id for admin in admins)
+    _admin_cache[chat_id] = (now + ADMIN_CACHE_TTL, admin_ids)
+    return user_id in admin_ids
+
+def admin_required(handler):
+    """Only run the handler in private chats or for group admins."""
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+        # Private chats need no admin lookup, so skip the await entirely
+        if update.effective_chat.type != 'private' and not await is_admin(update, context):
+            await update.message.reply_text("Only admins can use this command.")
+            return
+        return await handler(update, context)
+    return wrapper
+
+def _quoted_args(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Split a command's arguments shell-style, so "Multi Word" names arrive as one argument."""
+    try:
+        return shlex.split(update.message.text)[1:]
+    except ValueError:
+        # Unbalanced quote: fall back to Telegram's whitespace split
+        return [arg.strip('"') for arg in context.args]
+
+def _render_today_targets(todays_targets):
+    """Build the group's today-targets message shared by /view_today and scheduled posts."""
+    render_done = TODAY_TARGET_DONE_TEMPLATE.format_map
+    render_open = TODAY_TARGET_OPEN_TEMPLATE.format_map
+    parts = ["🎯 **Today's Warriors & Their Targets** 🎯\n\n"]
+    for i, (user_id, user_data) in enumerate(todays_targets.items(), 1):
+        user_name = user_data.get("name", "Unknown User")
+        targets = user_data["targets"]
+        
+        parts.append(TODAY_USER_TEMPLATE.format(i=i, name=user_name))
+        completed_count = 0
+        for target_obj in targets:
+            if target_obj["completed"]:
+                parts.append(render_done(target_obj))
+                completed_count += 1
+            else:
+                parts.append(render_open(target_obj))
+        
+        if targets:
+            progress_percent = (completed_count / len(targets)) * 100
+            parts.append(f"   📊 {completed_count}/{len(targets)} ({progress_percent:.0f}%) completed\n")
+        parts.append("\n")
+    parts.append(get_random_quote())
+    return "".join(parts)
+
+def _render_status(data, today, todays_targets):
+    """Build the group status message shared by /status and scheduled posts."""
+    parts = [get_random_quote(), "\n---\n⏳ **Group Status** ⏳\n\n"]
+    
+    # Next Deadline
+    next_deadline = _next_milestone(data, today.isoformat())
+    if next_deadline:
+        deadline_date = _stored_date(next_deadline["date"])
+        days_left = (deadline_date - today).days
+        parts.append(f"**NEXT DEADLINE** ({days_left} days left):\n")
+        parts.append(f"🎯 *{next_deadline['description']}* (by {next_deadline['date']})\n\n")
+    else:
+        parts.append("No upcoming deadlines.\n\n")
+    
+    # Daily Warriors
+    parts.append("🏃‍♂️ **Warriors in the Arena Today:**\n")
+    if todays_targets:
+        for user_data in todays_targets.values():
+            parts.append(f"- {user_data.get('name', 'Unknown')}\n")
+    else:
+        parts.append("- *No one yet. Be the first!* 🔥\n")
+    
+    parts.append("\nFocus on your daily objective. The obstacle is the way.")
+    return "".join(parts)
+
+def _render_dashboard(data, user_id, user_name, today_str):
+    """Build a user's /dashboard message: syllabus progress, then today's targets."""
+    parts = [f"📊 **{user_name}'s GATE Progress Dashboard** 📊\n\n", "📚 **GATE Syllabus Progress:**\n"]
+    
+    # Get user progress
+    user_progress = data.get("user_progress", {}).get(user_id, {})
+    
+    total_topics_all = data["_totals"]["all"]
+    completed_topics_all = 0
+    
+    for subject_name, total_topics in data["_totals"]["per_subject"].items():
+        completed_topics = 0
+        if subject_name in user_progress and "completed_topics" in user_progress[subject_name]:
+            completed_topics = len(user_progress[subject_name]["completed_topics"])
+            completed_topics_all += completed_topics
+        
+        percentage = (completed_topics / total_topics) * 100 if total_topics > 0 else 0
+        
+        # Progress bar; capped in case a re-added subject has fewer topics than were completed
+        progress_bar = PROGRESS_BARS[min(int(percentage / 10), 10)]
+        
+        parts.append(f"**{subject_name}**\n{progress_bar} {percentage:.1f}%\n📝 {completed_topics}/{total_topics} topics completed\n\n")
+    
+    # Overall progress
+    overall_percentage = (completed_topics_all / total_topics_all) * 100 if total_topics_all > 0 else 0
+    overall_bar = PROGRESS_BARS[min(int(overall_percentage / 10), 10)]
+    
+    parts.append("🎯 **OVERALL GATE SYLLABUS PROGRESS**\n")
+    parts.append(f"{overall_bar} {overall_percentage:.1f}%\n")
+    parts.append(f"📚 {completed_topics_all}/{total_topics_all} syllabus topics completed\n\n")
+    
+    # Show today's personal target if set
+    user_targets = _user_targets(data, today_str, user_id)
+    if user_targets:
+        targets = user_targets["targets"]
+        
+        parts.append("🎯 **Today's Personal Targets:**\n")
+        completed_count = 0
+        for i, target_obj in enumerate(targets, 1):
+            if target_obj["completed"]:
+                parts.append(f"✅ {i}. ~~{target_obj['text']}~~\n")
+                completed_count += 1
+            else:
+                parts.append(f"⭕ {i}. _{target_obj['text']}_\n")
+        
+        if targets:
+            progress_percent = (completed_count / len(targets)) * 100
+            parts.append(f"📊 Personal targets: {completed_count}/{len(targets)} ({progress_percent:.0f}%) completed\n")
+        parts.append("\n")
+    else:
+        parts.append("💡 **Set your daily target:** `/today <your personal goal>`\n\n")
+    
+    # Motivational quote
+    parts.append(get_random_quote())
+    return "".join(parts)
 
-async def show_user_targets_for_date(update: Update, user_id: str, user_name: str, date_str: str):
+async def show_user_targets_for_date(update: Update, user_id: str, user_name: str, date_str: str, today_str: str):
     """Helper function to display user's targets for a specific date"""
     # Handle cases where update.message might be None
     if not update.message:
         return
         
-    data = load_data()
+    user_targets = _user_targets(store.get(), date_str, user_id)
     
-    if (date_str not in data.get("daily_targets", {}) or 
-        user_id not in data["daily_targets"][date_str]):
-        if date_str == datetime.now().strftime("%Y-%m-%d"):
+    if not user_targets:
+        if date_str == today_str:
             await update.message.reply_text("You don't have any targets set for today. Use `/today <goal>` to set one!")
         else:
             await update.message.reply_text(f"You don't have any targets set for {date_str}. Use `/set_date_target {date_str} <goal>` to set one!")
         return
     
-    user_targets = data["daily_targets"][date_str][user_id]
-    targets = user_targets.get("targets", [])
-    
-    # Handle old format conversion
-    if targets and isinstance(targets[0], str):
-        # Convert old format to new format
-        new_targets = []
-        for target in targets:
-            new_targets.append({"text": target, "completed": False, "completed_at": None})
-        user_targets["targets"] = new_targets
-        save_data(data)
-        targets = new_targets
-    
-    date_display = "Today" if date_str == datetime.now().strftime("%Y-%m-%d") else date_str
-    message = f"🎯 **Your Targets for {date_display}** 🎯\n\n"
-    
-    completed_count = 0
-    for i, target_obj in enumerate(targets, 1):
-        if target_obj["completed"]:
-            message += f"✅ **{i}.** ~~{target_obj['text']}~~\n"
-            completed_count += 1
-        else:
-            message += f"⭕ **{i}.** {target_obj['text']}\n"
+    targets = user_targets["targets"]
     
+    date_display = "Today" if date_str == today_str else date_str
+    target_list = "".join(
+        f"✅ **{i}.** ~~{target_obj['text']}~~\n" if target_obj["completed"] else f"⭕ **{i}.** {target_obj['text']}\n"
+        for i, target_obj in enumerate(targets, 1)
+    )
+    completed_count = sum(1 for target_obj in targets if target_obj["completed"])
     progress_percent = (completed_count / len(targets)) * 100 if targets else 0
-    message += f"\n📊 **Progress:** {completed_count}/{len(targets)} ({progress_percent:.0f}%) completed\n"
     
-    message += f"\n💡 Use `/complete_goal {date_str} <number>` to mark as done\n"
-    message += f"💡 Use `/edit_target <number> <new_goal>` to edit\n"
-    message += f"💡 Use `/delete_target <number>` to delete"
+    message = (
+        f"🎯 **Your Targets for {date_display}** 🎯\n\n"
+        f"{target_list}"
+        f"\n📊 **Progress:** {completed_count}/{len(targets)} ({progress_percent:.0f}%) completed\n"
+        f"{TARGETS_TIPS_TEMPLATE.format(date_str=date_str)}"
+    )
     
     await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
 
@@ -112,54 +555,22 @@ async def set_date_target(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     try:
-        date_str = context.args[0]
-        # Validate date format
-        datetime.strptime(date_str, "%Y-%m-%d")
+        # Validate, and key the target by the canonical YYYY-MM-DD form
+        date_str = _parse_date(context.args[0]).isoformat()
     except ValueError:
         await update.message.reply_text("Please use the correct date format: YYYY-MM-DD (e.g., 2025-08-10)")
         return
     
     target = " ".join(context.args[1:])
     
-    data = load_data()
-    if date_str not in data["daily_targets"]:
-        data["daily_targets"][date_str] = {}
-    
-    if user_id not in data["daily_targets"][date_str]:
-        data["daily_targets"][date_str][user_id] = {"name": user_name, "targets": []}
-    
-    # Handle data migration from old format to new format
-    user_data = data["daily_targets"][date_str][user_id]
-    if "targets" not in user_data:
-        # Migrate from old format
-        if "target" in user_data:
-            # Convert old single target or list of strings to new format
-            old_targets = user_data["target"]
-            if isinstance(old_targets, str):
-                # Single target (very old format)
-                new_targets = [{"text": old_targets, "completed": False, "completed_at": None}]
-            elif isinstance(old_targets, list):
-                # List of strings (old format)
-                new_targets = []
-                for target in old_targets:
-                    if isinstance(target, str):
-                        new_targets.append({"text": target, "completed": False, "completed_at": None})
-                    else:
-                        new_targets.append(target)  # Already in new format
-            else:
-                new_targets = []
-            user_data["targets"] = new_targets
-            del user_data["target"]  # Remove old key
-        else:
-            # No targets at all, create empty list
-            user_data["targets"] = []
+    user_targets = _ensure_user_targets(store.get(), date_str, user_id, user_name)
     
     # Add the new target with completion status
     target_obj = {"text": target, "completed": False, "completed_at": None}
-    data["daily_targets"][date_str][user_id]["targets"].append(target_obj)
-    save_data(data)
+    user_targets["targets"].append(target_obj)
+    store.mark_dirty()
     
-    target_count = len(data["daily_targets"][date_str][user_id]["targets"])
+    target_count = len(user_targets["targets"])
     await update.message.reply_text(f"✅ Target {target_count} set for {date_str}. Lock and load!")
 
 async def complete_goal(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -170,48 +581,35 @@ async def complete_goal(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Usage: /complete_goal YYYY-MM-DD <target_number>\n\nExample: `/complete_goal 2025-08-03 1` to complete your first target for that date\nOr use: `/complete_goal today 1` for today's targets")
         return
     
+    now = datetime.now()
+    today_str = now.date().isoformat()
     date_input = context.args[0]
     if date_input.lower() == "today":
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        date_str = today_str
     else:
         try:
             # Validate date format
-            datetime.strptime(date_input, "%Y-%m-%d")
-            date_str = date_input
+            date_str = _parse_date(date_input).isoformat()
         except ValueError:
             await update.message.reply_text("Please use the correct date format: YYYY-MM-DD or 'today'")
             return
     
     try:
         target_number = int(context.args[1])
-        if target_number < 1:
-            raise ValueError("Target number must be positive")
     except ValueError:
         await update.message.reply_text("Please provide a valid target number (1, 2, 3, etc.)")
         return
     
-    data = load_data()
+    user_targets = _user_targets(store.get(), date_str, user_id)
     
-    if (date_str not in data.get("daily_targets", {}) or 
-        user_id not in data["daily_targets"][date_str]):
+    if not user_targets:
         await update.message.reply_text(f"You don't have any targets set for {date_str}.")
         return
     
-    user_targets = data["daily_targets"][date_str][user_id]
-    targets = user_targets.get("targets", [])
-    
-    # Handle old format conversion
-    if targets and isinstance(targets[0], str):
-        # Convert old format to new format
-        new_targets = []
-        for target in targets:
-            new_targets.append({"text": target, "completed": False, "completed_at": None})
-        user_targets["targets"] = new_targets
-        save_data(data)
-        targets = new_targets
+    targets = user_targets["targets"]
     
-    if target_number > len(targets):
-        await update.message.reply_text(f"You only have {len(targets)} target(s) for {date_str}. Cannot complete target #{target_number}.")
+    if not 1 <= target_number <= len(targets):
+        await update.message.reply_text(f"You have {len(targets)} target(s) for {date_str}. Please pick a target number from 1 to {len(targets)}.")
         return
     
     target_obj = targets[target_number - 1]
@@ -222,63 +620,59 @@ async def complete_goal(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Mark as completed
     target_obj["completed"] = True
-    target_obj["completed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    target_obj["completed_at"] = now.strftime("%Y-%m-%d %H:%M:%S")
     
-    save_data(data)
+    store.mark_dirty()
     
     # Calculate progress
     completed_count = sum(1 for t in targets if t["completed"])
     total_count = len(targets)
     progress_percent = (completed_count / total_count) * 100
     
-    date_display = "today" if date_str == datetime.now().strftime("%Y-%m-%d") else date_str
+    date_display = "today" if date_str == today_str else date_str
     await update.message.reply_text(f"🎉 Target #{target_number} completed for {date_display}!\n\n✅ _{target_obj['text']}_\n\n📊 Progress: {completed_count}/{total_count} ({progress_percent:.0f}%) completed\n\n{get_random_quote()}")
 
 # --- Admin Commands ---
+@admin_required
 async def set_milestone(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-
     try:
         parts = context.args
-        date_str = parts[0]
+        # Validate, and store the canonical YYYY-MM-DD form
+        date_str = _parse_date(parts[0]).isoformat()
         description = " ".join(parts[1:]).strip('"')
-        deadline = datetime.strptime(date_str, "%Y-%m-%d")
 
-        data = load_data()
-        data["milestones"].append({"date": date_str, "description": description})
-        data["milestones"].sort(key=lambda x: x["date"])
-        save_data(data)
+        data = store.get()
+        _add_milestone(data, {"date": date_str, "description": description}, date.today().isoformat())
+        store.mark_dirty()
         
         await update.message.reply_text(f"✅ Milestone set for {date_str}: {description}")
     except (IndexError, ValueError):
         await update.message.reply_text("Usage: /set_milestone YYYY-MM-DD \"Description\"")
 
+@admin_required
 async def edit_milestone(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-
     try:
         m_num_str, field, new_value = context.args[0], context.args[1].lower(), " ".join(context.args[2:])
         m_num = int(m_num_str) - 1
 
-        data = load_data()
-        if not (0 <= m_num < len(data["milestones"])):
+        data = store.get()
+        milestones = _all_milestones(data)
+        if not (0 <= m_num < len(milestones)):
             await update.message.reply_text("Invalid milestone number.")
             return
 
         if field == "date":
-            datetime.strptime(new_value, "%Y-%m-%d") # Validate date format
-            data["milestones"][m_num]["date"] = new_value
-            data["milestones"].sort(key=lambda x: x["date"])
+            new_value = _parse_date(new_value).isoformat() # Validate date format
+            # The date is the sort key, so re-insert instead of editing in place
+            milestone = _pop_milestone(data, m_num)
+            milestone["date"] = new_value
+            _add_milestone(data, milestone, date.today().isoformat())
         elif field == "description":
-            data["milestones"][m_num]["description"] = new_value.strip('"')
+            milestones[m_num]["description"] = new_value.strip('"')
         else:
             raise ValueError("Invalid field")
         
-        save_data(data)
+        store.mark_dirty()
         await update.message.reply_text(f"✅ Milestone {m_num + 1} updated.")
 
     except (IndexError, ValueError):
@@ -286,75 +680,70 @@ async def edit_milestone(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def view_plan(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    data = load_data()
-    if not data["milestones"]:
+    data = store.get()
+    milestones = _all_milestones(data)
+    if not milestones:
         await update.message.reply_text("No plan set yet. Use /set_milestone to create one.")
         return
 
-    message = "🗓️ **Our Group's Prep Plan** 🗓️\n\n"
-    today = datetime.now()
-    for i, ms in enumerate(data["milestones"]):
-        deadline = datetime.strptime(ms["date"], "%Y-%m-%d")
+    parts = ["🗓️ **Our Group's Prep Plan** 🗓️\n\n"]
+    today = date.today()
+    for i, ms in enumerate(milestones):
+        deadline = _stored_date(ms["date"])
         days_left = (deadline - today).days
-        message += f"🎯 **Milestone {i+1}:** {ms['description']}\n"
-        message += f"   -> **Deadline:** {ms['date']} ({days_left} days left)\n\n"
+        parts.append(f"🎯 **Milestone {i+1}:** {ms['description']}\n")
+        parts.append(f"   -> **Deadline:** {ms['date']} ({days_left} days left)\n\n")
     
-    await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
+    await update.message.reply_text("".join(parts), parse_mode=ParseMode.MARKDOWN)
 
+@admin_required
 async def clear_plan(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-    data = load_data()
-    data["milestones"] = []
-    save_data(data)
+    data = store.get()
+    data["milestones"].clear()
+    data["past_milestones"].clear()
+    store.mark_dirty()
     await update.message.reply_text("🗑️ The entire plan has been cleared.")
 
+@admin_required
 async def delete_milestone(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-    
     if len(context.args) < 1:
         await update.message.reply_text("Usage: /delete_milestone <milestone_number>\n\nExample: `/delete_milestone 2` to delete the 2nd milestone")
         return
     
     try:
         milestone_number = int(context.args[0])
-        if milestone_number < 1:
-            raise ValueError("Milestone number must be positive")
     except ValueError:
         await update.message.reply_text("Please provide a valid milestone number (1, 2, 3, etc.)")
         return
     
-    data = load_data()
-    if not data["milestones"]:
+    data = store.get()
+    milestone_count = len(data["past_milestones"]) + len(data["milestones"])
+    if not milestone_count:
         await update.message.reply_text("No milestones exist to delete. Use /view_plan to see current milestones.")
         return
     
-    if milestone_number > len(data["milestones"]):
-        await update.message.reply_text(f"Only {len(data['milestones'])} milestone(s) exist. Cannot delete milestone #{milestone_number}.")
+    if not 1 <= milestone_number <= milestone_count:
+        await update.message.reply_text(f"{milestone_count} milestone(s) exist. Please pick a milestone number from 1 to {milestone_count}.")
         return
     
     # Delete the milestone
-    deleted_milestone = data["milestones"].pop(milestone_number - 1)
-    save_data(data)
+    deleted_milestone = _pop_milestone(data, milestone_number - 1)
+    store.mark_dirty()
     
-    await update.message.reply_text(f"🗑️ Milestone #{milestone_number} deleted:\n\n📅 **{deleted_milestone['date']}**\n📝 {deleted_milestone['description']}\n\nRemaining milestones: {len(data['milestones'])}")
+    await update.message.reply_text(f"🗑️ Milestone #{milestone_number} deleted:\n\n📅 **{deleted_milestone['date']}**\n📝 {deleted_milestone['description']}\n\nRemaining milestones: {milestone_count - 1}")
 
+@admin_required
 async def delete_topic(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
+    args = _quoted_args(update, context)
     
-    if len(context.args) < 2:
+    if len(args) < 2:
         await update.message.reply_text("Usage: /delete_topic \"Subject Name\" \"Topic Name\"\n\nExample: `/delete_topic \"Mathematics\" \"Linear Algebra\"` to delete that specific topic")
         return
     
-    subject_name = context.args[0].strip('"')
-    topic_name = " ".join(context.args[1:]).strip('"')
+    subject_name = args[0]
+    topic_name = " ".join(args[1:])
     
-    data = load_data()
+    data = store.get()
     if "subjects" not in data or subject_name not in data["subjects"]:
         await update.message.reply_text(f"Subject '{subject_name}' not found. Use /view_subjects to see all available subjects.")
         return
@@ -365,20 +754,16 @@ async def delete_topic(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Remove the topic
     data["subjects"][subject_name]["topics"].remove(topic_name)
-    data["subjects"][subject_name]["total_topics"] = len(data["subjects"][subject_name]["topics"])
+    _set_subject_total(data, subject_name, len(data["subjects"][subject_name]["topics"]))
     
     # Also remove from user progress
-    removed_from_users = []
-    if "user_progress" in data:
-        for user_id in data["user_progress"]:
-            if subject_name in data["user_progress"][user_id]:
-                user_completed = data["user_progress"][user_id][subject_name]["completed_topics"]
-                if topic_name in user_completed:
-                    user_completed.remove(topic_name)
-                    user_name = data["user_progress"][user_id].get("name", "Unknown User")
-                    removed_from_users.append(user_name)
-    
-    save_data(data)
+    user_progress = data["user_progress"]
+    removed_from_users = [
+        user_progress[user_id].get("name", "Unknown User")
+        for user_id in _remove_topic_progress(data, subject_name, topic_name)
+    ]
+    
+    store.mark_dirty()
     
     message = f"🗑️ Topic '{topic_name}' deleted from subject '{subject_name}'\n\n"
     message += f"📚 Remaining topics in {subject_name}: {data['subjects'][subject_name]['total_topics']}\n"
@@ -388,91 +773,91 @@ async def delete_topic(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     await update.message.reply_text(message)
 
+@admin_required
 async def add_subject(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-
+    args = _quoted_args(update, context)
+    
     try:
-        if len(context.args) < 2:
+        if len(args) < 2:
             await update.message.reply_text("Usage: /add_subject \"Subject Name\" topic1,topic2,topic3")
             return
             
-        subject_name = context.args[0].strip('"')
-        topics_str = " ".join(context.args[1:])
+        subject_name = args[0]
+        topics_str = " ".join(args[1:])
         topics = [topic.strip() for topic in topics_str.split(',')]
         
-        data = load_data()
+        data = store.get()
         if "subjects" not in data:
             data["subjects"] = {}
             
-        data["subjects"][subject_name] = {
-            "topics": topics,
-            "total_topics": len(topics)
-        }
-        save_data(data)
+        data["subjects"][subject_name] = {"topics": topics}
+        _set_subject_total(data, subject_name, len(topics))
+        store.mark_dirty()
         
         await update.message.reply_text(f"✅ Subject '{subject_name}' added with {len(topics)} topics:\n• " + "\n• ".join(topics))
     except Exception as e:
         await update.message.reply_text("Usage: /add_subject \"Subject Name\" topic1,topic2,topic3")
 
+@admin_required
 async def delete_subject(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-
+    args = _quoted_args(update, context)
+    
     try:
-        if len(context.args) < 1:
+        if len(args) < 1:
             await update.message.reply_text("Usage: /delete_subject \"Subject Name\"")
             return
             
-        subject_name = context.args[0].strip('"')
+        subject_name = args[0]
         
-        data = load_data()
+        data = store.get()
         if "subjects" not in data or subject_name not in data["subjects"]:
             await update.message.reply_text(f"Subject '{subject_name}' not found.")
             return
         
         # Remove the subject
         del data["subjects"][subject_name]
+        _set_subject_total(data, subject_name, None)
+        data["_topic_index"].pop(subject_name, None)
         
         # Also remove user progress for this subject
-        if "user_progress" in data:
-            for user_id in data["user_progress"]:
-                if subject_name in data["user_progress"][user_id]:
-                    del data["user_progress"][user_id][subject_name]
+        user_progress = data["user_progress"]
+        affected_users = [user_id for user_id, progress in user_progress.items() if subject_name in progress]
+        for user_id in affected_users:
+            del user_progress[user_id][subject_name]
         
-        save_data(data)
+        store.mark_dirty()
         
         await update.message.reply_text(f"🗑️ Subject '{subject_name}' and all related progress data has been deleted.")
     except Exception as e:
         await update.message.reply_text("Usage: /delete_subject \"Subject Name\"")
 
 async def view_subjects(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    data = load_data()
+    data = store.get()
     if "subjects" not in data or not data["subjects"]:
         await update.message.reply_text("No GATE syllabus subjects defined yet. Admins can use /add_subject to add syllabus topics.")
         return
     
-    message = "📚 **GATE Syllabus Subjects** 📚\n\n"
+    parts = ["📚 **GATE Syllabus Subjects** 📚\n\n"]
     for i, (subject, info) in enumerate(data["subjects"].items(), 1):
-        message += f"**{i}. {subject}**\n"
-        message += f"   📝 {info['total_topics']} syllabus topics\n"
-        message += f"   Topics: {', '.join(info['topics'][:3])}{'...' if len(info['topics']) > 3 else ''}\n\n"
+        parts.append(f"**{i}. {subject}**\n")
+        parts.append(f"   📝 {info['total_topics']} syllabus topics\n")
+        parts.append(f"   Topics: {', '.join(info['topics'][:3])}{'...' if len(info['topics']) > 3 else ''}\n\n")
     
-    message += "💡 Use `/complete \"Subject\" \"Topic\"` to mark syllabus topics as completed\n"
-    message += "💡 Use `/today <goal>` to set personal daily targets (separate from syllabus)"
+    parts.append("💡 Use `/complete \"Subject\" \"Topic\"` to mark syllabus topics as completed\n")
+    parts.append("💡 Use `/today <goal>` to set personal daily targets (separate from syllabus)")
     
-    await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
+    await update.message.reply_text("".join(parts), parse_mode=ParseMode.MARKDOWN)
 
 async def view_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if len(context.args) < 1:
+    args = _quoted_args(update, context)
+    
+    if len(args) < 1:
         await update.message.reply_text("Usage: /view_topics \"Subject Name\"\n\nExample: `/view_topics \"Mathematics\"` to see all topics in Mathematics")
         return
     
-    subject_name = " ".join(context.args).strip('"')
+    subject_name = " ".join(args)
     
-    data = load_data()
+    data = store.get()
     if "subjects" not in data or subject_name not in data["subjects"]:
         await update.message.reply_text(f"Subject '{subject_name}' not found. Use /view_subjects to see all available subjects.")
         return
@@ -480,14 +865,11 @@ async def view_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
     subject_info = data["subjects"][subject_name]
     topics = subject_info["topics"]
     
-    message = f"📝 **Topics in {subject_name}** 📝\n\n"
-    message += f"**Total Topics:** {len(topics)}\n\n"
-    
     # Show topics in numbered list
-    for i, topic in enumerate(topics, 1):
-        message += f"**{i}.** {topic}\n"
+    topic_list = "".join(f"**{i}.** {topic}\n" for i, topic in enumerate(topics, 1))
     
     # Show user's progress if available
+    progress_sections = []
     user_id = str(update.effective_user.id)
     if ("user_progress" in data and user_id in data["user_progress"] and 
         subject_name in data["user_progress"][user_id]):
@@ -495,31 +877,34 @@ async def view_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
         completed_count = len(completed_topics)
         progress_percent = (completed_count / len(topics)) * 100
         
-        message += f"\n📊 **Your Progress:** {completed_count}/{len(topics)} ({progress_percent:.1f}%) completed\n"
+        progress_sections.append(f"\n📊 **Your Progress:** {completed_count}/{len(topics)} ({progress_percent:.1f}%) completed\n")
         
         if completed_topics:
-            message += f"\n✅ **Completed Topics:**\n"
-            for topic in completed_topics:
-                message += f"• {topic}\n"
+            completed_list = "".join(f"• {topic}\n" for topic in topics if topic in completed_topics)
+            progress_sections.append(f"\n✅ **Completed Topics:**\n{completed_list}")
         
         remaining_topics = [t for t in topics if t not in completed_topics]
         if remaining_topics:
-            message += f"\n⭕ **Remaining Topics:**\n"
-            for topic in remaining_topics[:5]:  # Show first 5 remaining
-                message += f"• {topic}\n"
+            remaining_list = "".join(f"• {topic}\n" for topic in remaining_topics[:5])  # Show first 5 remaining
             if len(remaining_topics) > 5:
-                message += f"• ... and {len(remaining_topics) - 5} more\n"
+                remaining_list += f"• ... and {len(remaining_topics) - 5} more\n"
+            progress_sections.append(f"\n⭕ **Remaining Topics:**\n{remaining_list}")
     
-    message += f"\n💡 Use `/complete \"{subject_name}\" \"Topic Name\"` to mark topics as completed"
+    message = (
+        f"📝 **Topics in {subject_name}** 📝\n\n"
+        f"**Total Topics:** {len(topics)}\n\n"
+        f"{topic_list}"
+        f"{''.join(progress_sections)}"
+        f"\n💡 Use `/complete \"{subject_name}\" \"Topic Name\"` to mark topics as completed"
+    )
     
     await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
 
+@admin_required
 async def edit_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
+    args = _quoted_args(update, context)
     
-    if len(context.args) < 3:
+    if len(args) < 3:
         await update.message.reply_text(
             "Usage: /edit_topics \"Subject Name\" <add|remove|replace> <topics>\n\n"
             "Examples:\n"
@@ -529,11 +914,11 @@ async def edit_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    subject_name = context.args[0].strip('"')
-    action = context.args[1].lower()
-    topics_input = " ".join(context.args[2:]).strip('"')
+    subject_name = args[0]
+    action = args[1].lower()
+    topics_input = " ".join(args[2:])
     
-    data = load_data()
+    data = store.get()
     if "subjects" not in data or subject_name not in data["subjects"]:
         await update.message.reply_text(f"Subject '{subject_name}' not found. Use /view_subjects to see all available subjects.")
         return
@@ -543,14 +928,15 @@ async def edit_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if action == "add":
         new_topics = [topic.strip() for topic in topics_input.split(',')]
         # Filter out topics that already exist
-        unique_new_topics = [topic for topic in new_topics if topic not in current_topics]
+        existing_topics = set(current_topics)
+        unique_new_topics = [topic for topic in new_topics if topic not in existing_topics]
         
         if not unique_new_topics:
             await update.message.reply_text("All specified topics already exist in this subject.")
             return
         
         current_topics.extend(unique_new_topics)
-        data["subjects"][subject_name]["total_topics"] = len(current_topics)
+        _set_subject_total(data, subject_name, len(current_topics))
         
         await update.message.reply_text(f"✅ Added {len(unique_new_topics)} new topic(s) to '{subject_name}':\n• " + "\n• ".join(unique_new_topics))
     
@@ -562,15 +948,10 @@ async def edit_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
         
         current_topics.remove(topic_to_remove)
-        data["subjects"][subject_name]["total_topics"] = len(current_topics)
+        _set_subject_total(data, subject_name, len(current_topics))
         
         # Also remove from user progress
-        if "user_progress" in data:
-            for user_id in data["user_progress"]:
-                if subject_name in data["user_progress"][user_id]:
-                    user_completed = data["user_progress"][user_id][subject_name]["completed_topics"]
-                    if topic_to_remove in user_completed:
-                        user_completed.remove(topic_to_remove)
+        _remove_topic_progress(data, subject_name, topic_to_remove)
         
         await update.message.reply_text(f"🗑️ Removed topic '{topic_to_remove}' from '{subject_name}' and all user progress.")
     
@@ -578,71 +959,73 @@ async def edit_topics(update: Update, context: ContextTypes.DEFAULT_TYPE):
         new_topics = [topic.strip() for topic in topics_input.split(',')]
         old_count = len(current_topics)
         
-        # Get topics that will be removed
-        removed_topics = [topic for topic in current_topics if topic not in new_topics]
+        # Get topics that will be removed or added
+        new_topic_set = set(new_topics)
+        old_topic_set = set(current_topics)
+        removed_topics = [topic for topic in current_topics if topic not in new_topic_set]
+        added_count = sum(1 for topic in new_topics if topic not in old_topic_set)
         
         # Update the subject
         data["subjects"][subject_name]["topics"] = new_topics
-        data["subjects"][subject_name]["total_topics"] = len(new_topics)
+        _set_subject_total(data, subject_name, len(new_topics))
         
-        # Clean up user progress for removed topics
-        if removed_topics and "user_progress" in data:
-            for user_id in data["user_progress"]:
-                if subject_name in data["user_progress"][user_id]:
-                    user_completed = data["user_progress"][user_id][subject_name]["completed_topics"]
-                    # Remove completed topics that no longer exist
-                    data["user_progress"][user_id][subject_name]["completed_topics"] = [
-                        topic for topic in user_completed if topic in new_topics
-                    ]
+        # Clean up user progress: keep only completions that are in the new topic list,
+        # including stale ones left over from earlier edits
+        if removed_topics:
+            for topic in [t for t in data["_topic_index"].get(subject_name, {}) if t not in new_topic_set]:
+                _remove_topic_progress(data, subject_name, topic)
         
         await update.message.reply_text(
             f"🔄 Replaced all topics in '{subject_name}':\n"
             f"• **Old count:** {old_count} topics\n"
             f"• **New count:** {len(new_topics)} topics\n"
             f"• **Removed:** {len(removed_topics)} topics\n"
-            f"• **Added:** {len([t for t in new_topics if t not in current_topics])} topics"
+            f"• **Added:** {added_count} topics"
         )
     
     else:
         await update.message.reply_text("Invalid action. Use 'add', 'remove', or 'replace'.")
         return
     
-    save_data(data)
+    store.mark_dirty()
 
 # --- Reminder Commands ---
+async def archive_milestones_job(context: ContextTypes.DEFAULT_TYPE):
+    if _archive_past_milestones(store.get(), date.today().isoformat()):
+        store.mark_dirty()
+
 async def daily_reminder_job(context: ContextTypes.DEFAULT_TYPE):
     chat_id = context.job.chat_id
-    data = load_data()
-    
-    if not data["milestones"]: return
+    today = date.today()
+    today_str = today.isoformat()
 
-    today = datetime.now()
-    next_deadline = None
-    for ms in data["milestones"]:
-        deadline_date = datetime.strptime(ms["date"], "%Y-%m-%d")
-        if deadline_date > today:
-            next_deadline = ms
-            break
-
-    if not next_deadline: return
+    # Reuse today's message if the reminder fires again (e.g. after being rescheduled)
+    cached = context.chat_data.get('reminder_cache')
+    if cached and cached[0] == today_str:
+        message = cached[1]
+    else:
+        data = store.get()
+        next_deadline = _next_milestone(data, today_str)
+        if not next_deadline: return
 
-    deadline_date = datetime.strptime(next_deadline["date"], "%Y-%m-%d")
-    days_left = (deadline_date - today).days
+        deadline_date = _stored_date(next_deadline["date"])
+        days_left = (deadline_date - today).days
 
-    message = f"{get_random_quote()}\n---\n"
-    message += "**Time to execute. ☀️**\n\n"
-    message += f"🗓️ **{days_left} days** remain until your next deadline:\n"
-    message += f"🎯 *{next_deadline['description']}*\n\n"
-    message += "What will you conquer today?\nSet your target with the /today command."
+        message = "".join([
+            f"{get_random_quote()}\n---\n",
+            "**Time to execute. ☀️**\n\n",
+            f"🗓️ **{days_left} days** remain until your next deadline:\n",
+            f"🎯 *{next_deadline['description']}*\n\n",
+            "What will you conquer today?\nSet your target with the /today command.",
+        ])
+        context.chat_data['reminder_cache'] = (today_str, message)
 
-    await context.bot.send_message(chat_id=chat_id, text=message, parse_mode=ParseMode.MARKDOWN)
+    await context.bot.send_message(chat_id=chat_id, text=message, parse_mode=ParseMode.MARKDOWN,
+                                   link_preview_options=NO_LINK_PREVIEW)
 
 
+@admin_required
 async def set_daily_reminder(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-
     chat_id = update.message.chat_id
     try:
         time_str = context.args[0]
@@ -659,11 +1042,8 @@ async def set_daily_reminder(update: Update, context: ContextTypes.DEFAULT_TYPE)
     except (IndexError, ValueError):
         await update.message.reply_text("Usage: /set_daily_reminder HH:MM (e.g., 07:00)")
 
+@admin_required
 async def stop_daily_reminder(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-        
     if 'job' not in context.chat_data:
         await update.message.reply_text("No active reminder to stop.")
         return
@@ -677,98 +1057,34 @@ async def schedule_command_job(context: ContextTypes.DEFAULT_TYPE):
     job_data = context.job.data
     command = job_data['command']
     message = job_data.get('message', '')
+    today = date.today()
+    today_str = today.isoformat()
+    # Read straight from the in-memory store; firing a job never touches disk
+    data = store.get()
+    todays_targets = data["daily_targets"].get(today_str, {})
     
     if command == 'view_today':
         # Simulate the view_today command
-        data = load_data()
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        
-        if (today_str not in data.get("daily_targets", {}) or 
-            not data["daily_targets"][today_str]):
-            msg = "No daily targets set for today yet. Be the first with `/today <your goal>`!"
+        if not todays_targets:
+            text = "No daily targets set for today yet. Be the first with `/today <your goal>`!"
         else:
-            msg = "🎯 **Today's Warriors & Their Targets** 🎯\n\n"
-            
-            for i, (user_id, user_data) in enumerate(data["daily_targets"][today_str].items(), 1):
-                user_name = user_data.get("name", "Unknown User")
-                targets = user_data.get("targets", user_data.get("target", []))
-                
-                # Handle old format conversion
-                if targets and isinstance(targets[0], str):
-                    new_targets = []
-                    for target in targets:
-                        new_targets.append({"text": target, "completed": False, "completed_at": None})
-                    user_data["targets"] = new_targets
-                    targets = new_targets
-                    if "target" in user_data:
-                        del user_data["target"]
-                
-                msg += f"**{i}) {user_name}**\n"
-                completed_count = 0
-                for j, target_obj in enumerate(targets, 1):
-                    if isinstance(target_obj, dict):
-                        if target_obj["completed"]:
-                            msg += f"   ✅ ~~{target_obj['text']}~~\n"
-                            completed_count += 1
-                        else:
-                            msg += f"   ⭕ {target_obj['text']}\n"
-                    else:
-                        # Handle any remaining old format
-                        msg += f"   ⭕ {target_obj}\n"
-                
-                if targets:
-                    progress_percent = (completed_count / len(targets)) * 100
-                    msg += f"   📊 {completed_count}/{len(targets)} ({progress_percent:.0f}%) completed\n"
-                msg += "\n"
-            
-            msg += f"{get_random_quote()}"
-        
-        await context.bot.send_message(chat_id=chat_id, text=msg, parse_mode=ParseMode.MARKDOWN)
+            text = _render_today_targets(todays_targets)
+        await context.bot.send_message(chat_id=chat_id, text=text, parse_mode=ParseMode.MARKDOWN,
+                                       link_preview_options=NO_LINK_PREVIEW)
     
     elif command == 'status':
         # Simulate the status command
-        data = load_data()
-        msg = f"{get_random_quote()}\n---\n⏳ **Group Status** ⏳\n\n"
-        
-        # Next Deadline
-        today = datetime.now()
-        next_deadline = None
-        for ms in data.get("milestones", []):
-            deadline_date = datetime.strptime(ms["date"], "%Y-%m-%d")
-            if deadline_date > today:
-                next_deadline = ms
-                break
-        
-        if next_deadline:
-            deadline_date = datetime.strptime(next_deadline["date"], "%Y-%m-%d")
-            days_left = (deadline_date - today).days
-            msg += f"**NEXT DEADLINE** ({days_left} days left):\n"
-            msg += f"🎯 *{next_deadline['description']}* (by {next_deadline['date']})\n\n"
-        else:
-            msg += "No upcoming deadlines.\n\n"
-
-        # Daily Warriors
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        msg += "🏃‍♂️ **Warriors in the Arena Today:**\n"
-        if today_str in data.get("daily_targets", {}) and data["daily_targets"][today_str]:
-            for user_id, user_data in data["daily_targets"][today_str].items():
-                msg += f"- {user_data.get('name', 'Unknown')}\n"
-        else:
-            msg += "- *No one yet. Be the first!* 🔥\n"
-
-        msg += "\nFocus on your daily objective. The obstacle is the way."
-        await context.bot.send_message(chat_id=chat_id, text=msg, parse_mode=ParseMode.MARKDOWN)
+        await context.bot.send_message(chat_id=chat_id, text=_render_status(data, today, todays_targets),
+                                       parse_mode=ParseMode.MARKDOWN, link_preview_options=NO_LINK_PREVIEW)
     
     else:
         # Custom message
         if message:
-            await context.bot.send_message(chat_id=chat_id, text=message, parse_mode=ParseMode.MARKDOWN)
+            await context.bot.send_message(chat_id=chat_id, text=message, parse_mode=ParseMode.MARKDOWN,
+                                           link_preview_options=NO_LINK_PREVIEW)
 
+@admin_required
 async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-
     if len(context.args) < 3:
         await update.message.reply_text(
             "Usage: /schedule HH:MM <command|message> <content>\n\n"
@@ -814,11 +1130,8 @@ async def schedule_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     except (IndexError, ValueError):
         await update.message.reply_text("Usage: /schedule HH:MM <command|message> <content>")
 
+@admin_required
 async def stop_scheduled_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not await is_admin(update, context):
-        await update.message.reply_text("Only admins can use this command.")
-        return
-        
     chat_id = update.message.chat_id
     job_key = f'scheduled_job_{chat_id}'
     
@@ -834,8 +1147,7 @@ async def stop_scheduled_command(update: Update, context: ContextTypes.DEFAULT_T
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text("Hello! I am the GATE Target Tracker. Use /view_plan to see our goals or set your /today target.")
 
-async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    help_text = """
+HELP_TEXT = """
 🎯 **GATE Target Tracker Commands** 🎯
 
 **📋 General Commands:**
@@ -895,109 +1207,43 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 *"The obstacle is the way." - Marcus Aurelius*
 """
-    await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
+
+async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(HELP_TEXT, parse_mode=ParseMode.MARKDOWN)
 
 async def set_today_target(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = str(update.effective_user.id)
     user_name = update.effective_user.first_name
     
+    today_str = date.today().isoformat()
+    
     # If no arguments provided, show today's targets
     if not context.args:
-        await show_user_targets_for_date(update, user_id, user_name, datetime.now().strftime("%Y-%m-%d"))
+        await show_user_targets_for_date(update, user_id, user_name, today_str, today_str)
         return
     
     target = " ".join(context.args)
     
-    data = load_data()
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    if today_str not in data["daily_targets"]:
-        data["daily_targets"][today_str] = {}
-    
-    if user_id not in data["daily_targets"][today_str]:
-        data["daily_targets"][today_str][user_id] = {"name": user_name, "targets": []}
-    
-    # Handle data migration from old format to new format
-    user_data = data["daily_targets"][today_str][user_id]
-    if "targets" not in user_data:
-        # Migrate from old format
-        if "target" in user_data:
-            # Convert old single target or list of strings to new format
-            old_targets = user_data["target"]
-            if isinstance(old_targets, str):
-                # Single target (very old format)
-                new_targets = [{"text": old_targets, "completed": False, "completed_at": None}]
-            elif isinstance(old_targets, list):
-                # List of strings (old format)
-                new_targets = []
-                for target in old_targets:
-                    if isinstance(target, str):
-                        new_targets.append({"text": target, "completed": False, "completed_at": None})
-                    else:
-                        new_targets.append(target)  # Already in new format
-            else:
-                new_targets = []
-            user_data["targets"] = new_targets
-            del user_data["target"]  # Remove old key
-        else:
-            # No targets at all, create empty list
-            user_data["targets"] = []
+    user_targets = _ensure_user_targets(store.get(), today_str, user_id, user_name)
     
     # Add the new target with completion status
     target_obj = {"text": target, "completed": False, "completed_at": None}
-    data["daily_targets"][today_str][user_id]["targets"].append(target_obj)
-    save_data(data)
+    user_targets["targets"].append(target_obj)
+    store.mark_dirty()
     
-    target_count = len(data["daily_targets"][today_str][user_id]["targets"])
+    target_count = len(user_targets["targets"])
     await update.message.reply_text(f"✅ Target {target_count} locked in. Make it happen.")
 
 async def view_today_targets(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    data = load_data()
-    today_str = datetime.now().strftime("%Y-%m-%d")
+    data = store.get()
+    today_str = date.today().isoformat()
+    todays_targets = data["daily_targets"].get(today_str)
     
-    if (today_str not in data.get("daily_targets", {}) or 
-        not data["daily_targets"][today_str]):
+    if not todays_targets:
         await update.message.reply_text("No daily targets set for today yet. Be the first with `/today <your goal>`!")
         return
     
-    message = "🎯 **Today's Warriors & Their Targets** 🎯\n\n"
-    
-    for i, (user_id, user_data) in enumerate(data["daily_targets"][today_str].items(), 1):
-        user_name = user_data.get("name", "Unknown User")
-        targets = user_data.get("targets", user_data.get("target", []))  # Handle both old and new format
-        
-        # Convert old format to new format if needed
-        if targets and isinstance(targets[0], str):
-            new_targets = []
-            for target in targets:
-                new_targets.append({"text": target, "completed": False, "completed_at": None})
-            user_data["targets"] = new_targets
-            targets = new_targets
-            # Remove old format key if it exists
-            if "target" in user_data:
-                del user_data["target"]
-            save_data(data)
-        
-        message += f"**{i}) {user_name}**\n"
-        completed_count = 0
-        for j, target_obj in enumerate(targets, 1):
-            if isinstance(target_obj, dict):
-                if target_obj["completed"]:
-                    message += f"   ✅ ~~{target_obj['text']}~~\n"
-                    completed_count += 1
-                else:
-                    message += f"   ⭕ {target_obj['text']}\n"
-            else:
-                # Handle any remaining old format entries
-                message += f"   ⭕ {target_obj}\n"
-        
-        if targets:
-            progress_percent = (completed_count / len(targets)) * 100
-            message += f"   📊 {completed_count}/{len(targets)} ({progress_percent:.0f}%) completed\n"
-        message += "\n"
-    
-    message += f"{get_random_quote()}"
-    
-    await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
+    await update.message.reply_text(_render_today_targets(todays_targets), parse_mode=ParseMode.MARKDOWN)
 
 async def delete_target(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = str(update.effective_user.id)
@@ -1019,26 +1265,16 @@ async def delete_target(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Please provide a valid target number (1, 2, 3, etc.)")
         return
     
-    data = load_data()
-    today_str = datetime.now().strftime("%Y-%m-%d")
+    data = store.get()
+    today_str = date.today().isoformat()
     
-    if (today_str not in data.get("daily_targets", {}) or 
-        user_id not in data["daily_targets"][today_str]):
+    user_targets = _user_targets(data, today_str, user_id)
+    
+    if not user_targets:
         await update.message.reply_text("You don't have any daily targets set for today.")
         return
     
-    user_targets = data["daily_targets"][today_str][user_id]
-    targets = user_targets.get("targets", user_targets.get("target", []))
-    
-    # Convert old format to new format if needed
-    if targets and isinstance(targets[0], str):
-        new_targets = []
-        for target in targets:
-            new_targets.append({"text": target, "completed": False, "completed_at": None})
-        user_targets["targets"] = new_targets
-        if "target" in user_targets:
-            del user_targets["target"]
-        targets = new_targets
+    targets = user_targets["targets"]
     
     if target_number > len(targets):
         await update.message.reply_text(f"You only have {len(targets)} target(s) for today. Cannot delete target #{target_number}.")
@@ -1046,16 +1282,13 @@ async def delete_target(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Delete the target
     deleted_target = targets.pop(target_number - 1)
-    deleted_text = deleted_target["text"] if isinstance(deleted_target, dict) else deleted_target
+    deleted_text = deleted_target["text"]
     
     # If no targets left, remove the user entry for today
     if not targets:
-        del data["daily_targets"][today_str][user_id]
-        # If no users left for today, remove the date entry
-        if not data["daily_targets"][today_str]:
-            del data["daily_targets"][today_str]
+        _drop_user_targets(data, today_str, user_id)
     
-    save_data(data)
+    store.mark_dirty()
     
     remaining_count = len(targets)
     if remaining_count > 0:
@@ -1085,26 +1318,13 @@ async def edit_target(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     new_target = " ".join(context.args[1:])
     
-    data = load_data()
-    today_str = datetime.now().strftime("%Y-%m-%d")
+    user_targets = _user_targets(store.get(), date.today().isoformat(), user_id)
     
-    if (today_str not in data.get("daily_targets", {}) or 
-        user_id not in data["daily_targets"][today_str]):
+    if not user_targets:
         await update.message.reply_text("You don't have any daily targets set for today. Use `/today <goal>` to set one first.")
         return
     
-    user_targets = data["daily_targets"][today_str][user_id]
-    targets = user_targets.get("targets", user_targets.get("target", []))
-    
-    # Convert old format to new format if needed
-    if targets and isinstance(targets[0], str):
-        new_targets = []
-        for target in targets:
-            new_targets.append({"text": target, "completed": False, "completed_at": None})
-        user_targets["targets"] = new_targets
-        if "target" in user_targets:
-            del user_targets["target"]
-        targets = new_targets
+    targets = user_targets["targets"]
     
     if target_number > len(targets):
         await update.message.reply_text(f"You only have {len(targets)} target(s) for today. Cannot edit target #{target_number}.")
@@ -1112,15 +1332,10 @@ async def edit_target(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Edit the target
     target_obj = targets[target_number - 1]
-    old_target = target_obj["text"] if isinstance(target_obj, dict) else target_obj
+    old_target = target_obj["text"]
+    target_obj["text"] = new_target
     
-    if isinstance(target_obj, dict):
-        target_obj["text"] = new_target
-    else:
-        # Convert to new format while editing
-        targets[target_number - 1] = {"text": new_target, "completed": False, "completed_at": None}
-    
-    save_data(data)
+    store.mark_dirty()
     
     await update.message.reply_text(f"✏️ Target #{target_number} updated!\n\n**Old:** _{old_target}_\n**New:** _{new_target}_")
 
@@ -1132,23 +1347,24 @@ async def list_my_targets(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.message:
         return
     
+    today_str = date.today().isoformat()
+    
     # Check if date is specified
     if context.args and len(context.args) > 0:
         date_input = context.args[0]
         if date_input.lower() == "today":
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            date_str = today_str
         else:
             try:
                 # Validate date format
-                datetime.strptime(date_input, "%Y-%m-%d")
-                date_str = date_input
+                date_str = _parse_date(date_input).isoformat()
             except ValueError:
                 await update.message.reply_text("Please use the correct date format: YYYY-MM-DD or 'today'\n\nUsage: `/my_targets` for today or `/my_targets YYYY-MM-DD` for specific date")
                 return
     else:
-        date_str = datetime.now().strftime("%Y-%m-%d")
+        date_str = today_str
     
-    await show_user_targets_for_date(update, user_id, user_name, date_str)
+    await show_user_targets_for_date(update, user_id, user_name, date_str, today_str)
 
 async def complete_topic(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = str(update.effective_user.id)
@@ -1158,14 +1374,16 @@ async def complete_topic(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.message:
         return
     
-    if len(context.args) < 2:
+    args = _quoted_args(update, context)
+    
+    if len(args) < 2:
         await update.message.reply_text("Usage: /complete \"Subject Name\" \"Topic Name\"\n\nThis marks GATE syllabus topics as completed.")
         return
     
-    subject_name = context.args[0].strip('"')
-    topic_name = " ".join(context.args[1:]).strip('"')
+    subject_name = args[0]
+    topic_name = " ".join(args[1:])
     
-    data = load_data()
+    data = store.get()
     
     # Initialize data structures if needed
     if "subjects" not in data or subject_name not in data["subjects"]:
@@ -1183,13 +1401,14 @@ async def complete_topic(update: Update, context: ContextTypes.DEFAULT_TYPE):
         data["user_progress"][user_id] = {"name": user_name}
     
     if subject_name not in data["user_progress"][user_id]:
-        data["user_progress"][user_id][subject_name] = {"completed_topics": []}
+        data["user_progress"][user_id][subject_name] = {"completed_topics": set()}
     
     # Add topic if not already completed
     if topic_name not in data["user_progress"][user_id][subject_name]["completed_topics"]:
-        data["user_progress"][user_id][subject_name]["completed_topics"].append(topic_name)
-        data["user_progress"][user_id][subject_name]["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-        save_data(data)
+        data["user_progress"][user_id][subject_name]["completed_topics"].add(topic_name)
+        data["_topic_index"].setdefault(subject_name, {}).setdefault(topic_name, set()).add(user_id)
+        data["user_progress"][user_id][subject_name]["last_updated"] = date.today().isoformat()
+        store.mark_dirty()
         
         # Calculate progress
         completed = len(data["user_progress"][user_id][subject_name]["completed_topics"])
@@ -1208,92 +1427,13 @@ async def dashboard(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.message:
         return
     
-    data = load_data()
+    data = store.get()
     
     if "subjects" not in data or not data["subjects"]:
         await update.message.reply_text("No GATE syllabus subjects available yet. Contact admin to add syllabus.")
         return
     
-    message = f"📊 **{user_name}'s GATE Progress Dashboard** 📊\n\n"
-    message += "📚 **GATE Syllabus Progress:**\n"
-    
-    # Get user progress
-    user_progress = data.get("user_progress", {}).get(user_id, {})
-    
-    total_topics_all = 0
-    completed_topics_all = 0
-    
-    for subject_name, subject_info in data["subjects"].items():
-        total_topics = subject_info["total_topics"]
-        total_topics_all += total_topics
-        
-        completed_topics = 0
-        if subject_name in user_progress and "completed_topics" in user_progress[subject_name]:
-            completed_topics = len(user_progress[subject_name]["completed_topics"])
-            completed_topics_all += completed_topics
-        
-        percentage = (completed_topics / total_topics) * 100 if total_topics > 0 else 0
-        
-        # Progress bar
-        filled = int(percentage / 10)
-        empty = 10 - filled
-        progress_bar = "🟩" * filled + "⬜" * empty
-        
-        message += f"**{subject_name}**\n"
-        message += f"{progress_bar} {percentage:.1f}%\n"
-        message += f"📝 {completed_topics}/{total_topics} topics completed\n\n"
-    
-    # Overall progress
-    overall_percentage = (completed_topics_all / total_topics_all) * 100 if total_topics_all > 0 else 0
-    overall_filled = int(overall_percentage / 10)
-    overall_empty = 10 - overall_filled
-    overall_bar = "🟩" * overall_filled + "⬜" * overall_empty
-    
-    message += f"🎯 **OVERALL GATE SYLLABUS PROGRESS**\n"
-    message += f"{overall_bar} {overall_percentage:.1f}%\n"
-    message += f"📚 {completed_topics_all}/{total_topics_all} syllabus topics completed\n\n"
-    
-    # Show today's personal target if set
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    if (today_str in data.get("daily_targets", {}) and 
-        user_id in data["daily_targets"][today_str]):
-        user_targets = data["daily_targets"][today_str][user_id]
-        targets = user_targets.get("targets", user_targets.get("target", []))
-        
-        # Handle both old and new format
-        if targets and isinstance(targets[0], str):
-            new_targets = []
-            for target in targets:
-                new_targets.append({"text": target, "completed": False, "completed_at": None})
-            user_targets["targets"] = new_targets
-            targets = new_targets
-            if "target" in user_targets:
-                del user_targets["target"]
-            save_data(data)
-        
-        message += f"🎯 **Today's Personal Targets:**\n"
-        completed_count = 0
-        for i, target_obj in enumerate(targets, 1):
-            if isinstance(target_obj, dict):
-                if target_obj["completed"]:
-                    message += f"✅ {i}. ~~{target_obj['text']}~~\n"
-                    completed_count += 1
-                else:
-                    message += f"⭕ {i}. _{target_obj['text']}_\n"
-            else:
-                # Handle any remaining old format
-                message += f"⭕ {i}. _{target_obj}_\n"
-        
-        if targets:
-            progress_percent = (completed_count / len(targets)) * 100
-            message += f"📊 Personal targets: {completed_count}/{len(targets)} ({progress_percent:.0f}%) completed\n"
-        message += "\n"
-    else:
-        message += f"💡 **Set your daily target:** `/today <your personal goal>`\n\n"
-    
-    # Motivational quote
-    message += f"{get_random_quote()}"
-    
+    message = _render_dashboard(data, user_id, user_name, date.today().isoformat())
     await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
 
 async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -1301,37 +1441,10 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.message:
         return
         
-    data = load_data()
-    message = f"{get_random_quote()}\n---\n⏳ **Group Status** ⏳\n\n"
-    
-    # Next Deadline
-    today = datetime.now()
-    next_deadline = None
-    for ms in data["milestones"]:
-        deadline_date = datetime.strptime(ms["date"], "%Y-%m-%d")
-        if deadline_date > today:
-            next_deadline = ms
-            break
-    
-    if next_deadline:
-        deadline_date = datetime.strptime(next_deadline["date"], "%Y-%m-%d")
-        days_left = (deadline_date - today).days
-        message += f"**NEXT DEADLINE** ({days_left} days left):\n"
-        message += f"🎯 *{next_deadline['description']}* (by {next_deadline['date']})\n\n"
-    else:
-        message += "No upcoming deadlines.\n\n"
-
-    # Daily Warriors
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    message += "🏃‍♂️ **Warriors in the Arena Today:**\n"
-    if today_str in data["daily_targets"] and data["daily_targets"][today_str]:
-        for user_id, user_data in data["daily_targets"][today_str].items():
-            message += f"- {user_data['name']}\n"
-    else:
-        message += "- *No one yet. Be the first!* 🔥\n"
-
-    message += "\nFocus on your daily objective. The obstacle is the way."
-    await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN)
+    data = store.get()
+    today = date.today()
+    todays_targets = data["daily_targets"].get(today.isoformat())
+    await update.message.reply_text(_render_status(data, today, todays_targets), parse_mode=ParseMode.MARKDOWN)
 
 
 # --- Main Function to Run the Bot ---
@@ -1340,11 +1453,27 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logger.warning('Update "%s" caused error "%s"', update, context.error)
 
 async def main():
-    application = Application.builder().token(TOKEN).build()
+    application = (
+        Application.builder()
+        .token(TOKEN)
+        # Pace outgoing calls to Telegram's flood limits and retry after a 429
+        # instead of failing scheduled broadcasts to busy groups
+        .rate_limiter(AIORateLimiter(max_retries=3))
+        .post_init(load_data_on_startup)
+        .post_shutdown(flush_data_on_shutdown)
+        .build()
+    )
 
     # Add error handler
     application.add_error_handler(error_handler)
 
+    # Write in-memory data back to data.json whenever it has changed
+    application.job_queue.run_repeating(flush_data_job, interval=FLUSH_INTERVAL, first=FLUSH_INTERVAL)
+
+    # Move elapsed milestones out of the upcoming list at startup and every midnight
+    application.job_queue.run_once(archive_milestones_job, when=0)
+    application.job_queue.run_daily(archive_milestones_job, time=datetime(1,1,1,0,0).time())
+
     # Admin commands
     application.add_handler(CommandHandler("set_milestone", set_milestone))
     application.add_handler(CommandHandler("edit_milestone", edit_milestone))
@@ -1381,7 +1510,6 @@ async def main():
 
 
 if __name__ == '__main__':
-    import asyncio
     import nest_asyncio
     
     # Apply nest_asyncio to allow nested event loops